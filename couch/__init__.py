@@ -1,5 +1,5 @@
 from .client import CouchClient, connect
-from .config import CouchConfig
+from .config import CouchConfig, CouchConfigFast
 from .database import Database
 from .exceptions import (
     CouchError,
@@ -30,6 +30,7 @@ __all__ = [
     "BulkResult",
     "CouchClient",
     "CouchConfig",
+    "CouchConfigFast",
     "CouchError",
     "Database",
     "DatabaseAlreadyExistsError",
@@ -0,0 +1,33 @@
+"""Tight loops over decoded CouchDB JSON rows.
+
+These run over potentially millions of homogeneous row dicts, so they are
+kept as bare list comprehensions in one module. That keeps the hot code in
+one place and gives a single seam where a compiled (Cython/C) implementation
+could be dropped in later; this package ships pure Python.
+
+A Numba @njit variant of filter_ids was considered for very large _all_docs
+results and rejected: moving CPython strings into a numba typed list costs
+more than the filter itself, and the comprehension below already runs the
+per-row work in C. Revisit only if profiling shows this module dominating.
+"""
+
+from typing import Any
+
+DESIGN_PREFIX = "_design/"
+
+
+def filter_ids(rows: list[dict[str, Any]]) -> list[str]:
+    """Return row ids, skipping design documents."""
+    return [row["id"] for row in rows if not row["id"].startswith(DESIGN_PREFIX)]
+
+
+def extract_keys(rows: list[dict[str, Any]]) -> list[Any]:
+    return [row["key"] for row in rows]
+
+
+def extract_values(rows: list[dict[str, Any]]) -> list[Any]:
+    return [row["value"] for row in rows]
+
+
+def extract_docs(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [row["doc"] for row in rows if row.get("doc") is not None]
@@ -1,9 +1,12 @@
+import asyncio
+import base64
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
 import httpx
+from pydantic import SecretStr
 
-from .config import CouchConfig
+from .config import CouchConfig, CouchConfigFast
 from .database import Database
 from .exceptions import (
     DatabaseAlreadyExistsError,
@@ -12,19 +15,31 @@ from .exceptions import (
 )
 from .models import ServerInfo
 
+# System databases (_users, _replicator, ...) share this prefix.
+_SYS_PREFIX = "_"
+
 
 class CouchClient:
+    # Mirrors Database.fast_mode: trust CouchDB response shapes and skip
+    # pydantic validation for small server-generated models.
+    fast_mode: bool = True
+
     def __init__(self, client: httpx.AsyncClient) -> None:
         self._client = client
 
     async def get_info(self) -> ServerInfo:
         response = await self._client.get("")
         response.raise_for_status()
-        return ServerInfo.model_validate(response.json())
+        data = response.json()
+        if self.fast_mode:
+            return ServerInfo.model_construct(**data)
+        return ServerInfo.model_validate(data)
 
-    async def create_database(self, name: str) -> None:
+    async def create_database(self, name: str, *, partitioned: bool = False) -> None:
         try:
-            response = await self._client.put(name)
+            response = await self._client.put(
+                name, params={"partitioned": "true"} if partitioned else None
+            )
             response.raise_for_status()
         except httpx.HTTPStatusError as exc:
             rsp = ErrorResponse.model_validate_json(exc.response.text)
@@ -33,7 +48,7 @@ class CouchClient:
     async def all_databases(self) -> list[str]:
         response = await self._client.get("_all_dbs")
         response.raise_for_status()
-        return [db for db in response.json() if not db.startswith("_")]
+        return [db for db in response.json() if not db.startswith(_SYS_PREFIX)]
 
     async def delete_database(self, name: str) -> None:
         try:
@@ -43,6 +58,17 @@ class CouchClient:
             rsp = ErrorResponse.model_validate_json(exc.response.text)
             raise DatabaseNotFoundError(rsp) from exc
 
+    async def delete_all_databases(self) -> None:
+        """Delete every non-system database.
+
+        Deletes run concurrently over the connection pool; one failing
+        database does not stop the others.
+        """
+        dbs = await self.all_databases()
+        await asyncio.gather(
+            *(self.delete_database(db) for db in dbs), return_exceptions=True
+        )
+
     def database(self, name: str) -> Database:
         return Database(self._client, name)
 
@@ -56,14 +82,38 @@ class CouchClient:
 
 
 @asynccontextmanager
-async def connect(config: CouchConfig) -> AsyncIterator[CouchClient]:
-    """Create a CouchClient with properly configured HTTP client."""
+async def connect(
+    config: CouchConfig | CouchConfigFast,
+) -> AsyncIterator[CouchClient]:
+    """Create a CouchClient with properly configured HTTP client.
+
+    The client keeps connections alive and multiplexes concurrent requests
+    over HTTP/2, so callers using ``asyncio.gather`` over e.g. ``bulk_save``
+    get real parallelism without per-request TCP/TLS handshakes.
+    """
+    accept_encoding = (
+        "identity" if config.compression == "none" else config.compression
+    )
+    # The Basic auth header is constant for the life of the client, so
+    # compute it once instead of letting httpx re-encode it per request.
+    password = config.password
+    if isinstance(password, SecretStr):
+        password = password.get_secret_value()
+    credentials = f"{config.username}:{password}"
+    authorization = f"Basic {base64.b64encode(credentials.encode()).decode()}"
     async with httpx.AsyncClient(
-        auth=httpx.BasicAuth(
-            username=config.username, password=config.password.get_secret_value()
-        ),
         base_url=config.url,
         http2=True,
         verify=config.verify_ssl,
+        headers={
+            "Authorization": authorization,
+            "Accept": "application/json",
+            "Accept-Encoding": accept_encoding,
+        },
+        limits=httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        ),
     ) as http_client:
         yield CouchClient(http_client)
@@ -1,3 +1,6 @@
+from dataclasses import dataclass
+from typing import Literal
+
 from pydantic import SecretStr
 from pydantic_settings import BaseSettings
 
@@ -7,3 +10,28 @@ class CouchConfig(BaseSettings):
     username: str
     password: SecretStr
     verify_ssl: bool = True
+    max_connections: int = 200
+    max_keepalive_connections: int = 100
+    keepalive_expiry: float = 60.0
+    # Response compression negotiated with CouchDB. httpx decompresses
+    # transparently; zstd requires the zstandard package to be installed.
+    compression: Literal["none", "gzip", "zstd"] = "none"
+
+
+@dataclass(frozen=True, slots=True)
+class CouchConfigFast:
+    """Plain-dataclass alternative to CouchConfig.
+
+    Skips pydantic-settings environment scanning and validation, which
+    matters when configs are created per fixture or in tight startup paths.
+    connect() accepts either config type.
+    """
+
+    url: str
+    username: str
+    password: str
+    verify_ssl: bool = True
+    max_connections: int = 200
+    max_keepalive_connections: int = 100
+    keepalive_expiry: float = 60.0
+    compression: Literal["none", "gzip", "zstd"] = "none"
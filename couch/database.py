@@ -1,8 +1,11 @@
-import json
-from typing import Any, Never
+from collections.abc import AsyncIterator
+from typing import Any, Literal, NoReturn
 
 import httpx
+import ijson
+import orjson
 
+from ._fastpath import DESIGN_PREFIX, extract_docs, filter_ids
 from .exceptions import (
     CouchError,
     DocumentConflictError,
@@ -10,98 +13,204 @@ from .exceptions import (
     ErrorResponse,
 )
 from .models import (
-    AllDocsResponse,
+    _BULK_RESULTS_ADAPTER,
     BulkResult,
     DatabaseInfo,
     DocumentResponse,
-    FindQuery,
-    FindResponse,
     FindResult,
-    ViewResponse,
     ViewResult,
 )
 
 
+def _build_find_body(
+    selector: dict[str, Any],
+    fields: list[str] | None,
+    sort: list[dict[str, str]] | None,
+    limit: int | None,
+    skip: int | None,
+) -> bytes:
+    """Serialize a Mango query straight to bytes, skipping any model walk."""
+    body: dict[str, Any] = {"selector": selector}
+    if fields is not None:
+        body["fields"] = fields
+    if sort is not None:
+        body["sort"] = sort
+    if limit is not None:
+        body["limit"] = limit
+    if skip is not None:
+        body["skip"] = skip
+    return orjson.dumps(body)
+
+
+# Status-code to exception dispatch for document operations; anything not
+# listed raises the CouchError base.
+_STATUS_EXC: dict[int, type[CouchError]] = {
+    httpx.codes.NOT_FOUND: DocumentNotFoundError,
+    httpx.codes.CONFLICT: DocumentConflictError,
+}
+
+
+def _raise_document_error(exc: httpx.HTTPStatusError) -> NoReturn:
+    """Re-raise an HTTP error as the exception mapped to its status code."""
+    error = ErrorResponse.model_validate_json(exc.response.content)
+    raise _STATUS_EXC.get(exc.response.status_code, CouchError)(error) from exc
+
+
 class Database:
+    # CouchDB guarantees the shape of its own responses, so small models are
+    # built with model_construct by default. Set to False to run full
+    # pydantic validation (useful during development).
+    fast_mode: bool = True
+
     def __init__(self, client: httpx.AsyncClient, name: str) -> None:
         self._client = client
         self._name = name
+        # Precomputed endpoint URLs (parsed once) so hot paths skip both the
+        # per-call f-string build and httpx's URL parsing
+        self._doc_url_prefix = f"{name}/"
+        self._all_docs_url = httpx.URL(f"{name}/_all_docs")
+        self._bulk_url = httpx.URL(f"{name}/_bulk_docs")
+        self._find_url = httpx.URL(f"{name}/_find")
 
     @property
     def name(self) -> str:
         return self._name
 
-    def _handle_http_error(self, exc: httpx.HTTPStatusError) -> Never:
-        """Centralized error handling for HTTP status codes.
-
-        Args:
-            exc: The HTTPStatusError from httpx
-
-        Raises:
-            DocumentNotFoundError: For 404 errors
-            DocumentConflictError: For 409 errors
-            CouchError: For other CouchDB errors
-        """
-        response_data = ErrorResponse.model_validate_json(exc.response.text)
-
-        if exc.response.status_code == httpx.codes.NOT_FOUND:
-            raise DocumentNotFoundError(response_data) from exc
-        if exc.response.status_code == httpx.codes.CONFLICT:
-            raise DocumentConflictError(response_data) from exc
-        raise CouchError(response_data) from exc
-
     async def get_info(self) -> DatabaseInfo:
         response = await self._client.get(self._name)
         response.raise_for_status()
-        return DatabaseInfo.model_validate(response.json())
+        data = orjson.loads(response.content)
+        if self.fast_mode:
+            return DatabaseInfo.model_construct(**data)
+        return DatabaseInfo.model_validate(data)
 
     async def save(self, document: dict[str, Any]) -> DocumentResponse:
         try:
+            body = orjson.dumps(document)
+            headers = {"Content-Type": "application/json"}
             if "_id" in document:
                 response = await self._client.put(
-                    f"{self._name}/{document['_id']}", json=document
+                    self._doc_url_prefix + document["_id"],
+                    content=body,
+                    headers=headers,
                 )
             else:
-                response = await self._client.post(self._name, json=document)
+                response = await self._client.post(
+                    self._name, content=body, headers=headers
+                )
             response.raise_for_status()
-            return DocumentResponse.model_validate(response.json())
+            return self._document_response(response)
         except httpx.HTTPStatusError as exc:
-            self._handle_http_error(exc)
+            _raise_document_error(exc)
+
+    def _document_response(self, response: httpx.Response) -> DocumentResponse:
+        data = orjson.loads(response.content)
+        if self.fast_mode:
+            return DocumentResponse.model_construct(**data)
+        return DocumentResponse.model_validate(data)
 
     async def get(self, document_id: str, rev: str | None = None) -> dict[str, Any]:
         try:
-            url = f"{self._name}/{document_id}"
-            if rev:
-                url = f"{url}?rev={rev}"
-            response = await self._client.get(url)
+            response = await self._client.get(
+                self._doc_url_prefix + document_id,
+                params={"rev": rev} if rev else None,
+            )
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except httpx.HTTPStatusError as exc:
-            self._handle_http_error(exc)
+            _raise_document_error(exc)
 
     async def delete(self, document_id: str, rev: str) -> DocumentResponse:
         try:
             response = await self._client.delete(
-                f"{self._name}/{document_id}?rev={rev}"
+                self._doc_url_prefix + document_id, params={"rev": rev}
             )
             response.raise_for_status()
-            return DocumentResponse.model_validate(response.json())
+            return self._document_response(response)
         except httpx.HTTPStatusError as exc:
-            self._handle_http_error(exc)
+            _raise_document_error(exc)
+
+    async def get_many(self, document_ids: list[str]) -> list[dict[str, Any]]:
+        """Fetch multiple documents in a single request.
+
+        Uses the _all_docs endpoint with include_docs, so N documents cost
+        one roundtrip instead of N sequential gets. Missing ids are skipped.
+        """
+        response = await self._client.post(
+            self._all_docs_url,
+            content=orjson.dumps({"keys": document_ids}),
+            headers={"Content-Type": "application/json"},
+            params={"include_docs": "true"},
+        )
+        response.raise_for_status()
+        return extract_docs(orjson.loads(response.content)["rows"])
+
+    async def delete_many(self, documents: list[dict[str, Any]]) -> list[BulkResult]:
+        """Delete multiple documents in a single _bulk_docs request.
+
+        Each document needs an _id and _rev; results report per-document
+        success or failure just like bulk_save.
+        """
+        deletions = [
+            {"_id": doc["_id"], "_rev": doc["_rev"], "_deleted": True}
+            for doc in documents
+        ]
+        return await self.bulk_save(deletions)
+
+    async def _stream_items(
+        self,
+        method: str,
+        url: httpx.URL | str,
+        prefix: str,
+        content: bytes | None = None,
+    ) -> AsyncIterator[Any]:
+        """Stream items matching an ijson prefix from a JSON response body.
+
+        Items are parsed incrementally as bytes arrive, keeping peak memory
+        constant regardless of response size.
+        """
+        headers = {"Content-Type": "application/json"} if content else None
+        async with self._client.stream(
+            method, url, content=content, headers=headers
+        ) as response:
+            response.raise_for_status()
+            items = ijson.sendable_list()
+            parser = ijson.items_coro(items, prefix)
+            async for chunk in response.aiter_bytes():
+                parser.send(chunk)
+                for item in items:
+                    yield item
+                del items[:]
+            parser.close()
+            for item in items:
+                yield item
+
+    async def iter_document_ids(self) -> AsyncIterator[str]:
+        """Stream document ids from _all_docs without buffering the response.
+
+        Design documents are skipped.
+        """
+        async for doc_id in self._stream_items(
+            "GET", self._all_docs_url, "rows.item.id"
+        ):
+            if not doc_id.startswith(DESIGN_PREFIX):
+                yield doc_id
 
     async def all_document_ids(self) -> list[str]:
-        response = await self._client.get(f"{self._name}/_all_docs")
+        # Buffered fast path: one orjson parse plus the batch id filter.
+        # iter_document_ids remains the O(1)-memory alternative.
+        response = await self._client.get(self._all_docs_url)
         response.raise_for_status()
-        all_docs = AllDocsResponse.model_validate(response.json())
-        return [row.id for row in all_docs.rows if not row.id.startswith("_design/")]
+        return filter_ids(orjson.loads(response.content)["rows"])
 
     async def bulk_save(self, documents: list[dict[str, Any]]) -> list[BulkResult]:
         response = await self._client.post(
-            f"{self._name}/_bulk_docs", json={"docs": documents}
+            self._bulk_url,
+            content=orjson.dumps({"docs": documents}),
+            headers={"Content-Type": "application/json"},
         )
         response.raise_for_status()
-        results_data = response.json()
-        return [BulkResult.model_validate(result) for result in results_data]
+        return _BULK_RESULTS_ADAPTER.validate_json(response.content)
 
     async def find(
         self,
@@ -111,15 +220,34 @@ class Database:
         limit: int | None = None,
         skip: int | None = None,
     ) -> FindResult:
-        query = FindQuery(
-            selector=selector, fields=fields, sort=sort, limit=limit, skip=skip
-        )
         response = await self._client.post(
-            f"{self._name}/_find", json=query.model_dump(exclude_none=True)
+            self._find_url,
+            content=_build_find_body(selector, fields, sort, limit, skip),
+            headers={"Content-Type": "application/json"},
         )
         response.raise_for_status()
-        result = FindResponse.model_validate(response.json())
-        return FindResult(result.docs)
+        return FindResult(orjson.loads(response.content)["docs"])
+
+    async def iter_find(
+        self,
+        selector: dict[str, Any],
+        fields: list[str] | None = None,
+        sort: list[dict[str, str]] | None = None,
+        limit: int | None = None,
+        skip: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream matching documents from a Mango query without buffering.
+
+        Same arguments as find, but documents are yielded as they are
+        parsed from the response stream.
+        """
+        async for doc in self._stream_items(
+            "POST",
+            self._find_url,
+            "docs.item",
+            content=_build_find_body(selector, fields, sort, limit, skip),
+        ):
+            yield doc
 
     async def view(
         self,
@@ -129,6 +257,7 @@ class Database:
         key: Any | None = None,
         keys: list[Any] | None = None,
         startkey: Any | None = None,
+        startkey_docid: str | None = None,
         endkey: Any | None = None,
         limit: int | None = None,
         skip: int | None = None,
@@ -136,6 +265,8 @@ class Database:
         include_docs: bool = False,
         group: bool = False,
         reduce: bool = True,
+        update: Literal["true", "false", "lazy"] | None = None,
+        partition: str | None = None,
     ) -> ViewResult:
         """Query a CouchDB view.
 
@@ -145,6 +276,8 @@ class Database:
             key: Return only rows matching this key
             keys: Return only rows matching these keys (POST request)
             startkey: Start of key range
+            startkey_docid: Document id to start from within startkey
+                (for key-range pagination)
             endkey: End of key range
             limit: Limit number of results
             skip: Skip this many results
@@ -152,40 +285,121 @@ class Database:
             include_docs: Include full documents in results
             group: Group results (for reduce views)
             reduce: Whether to use reduce function (default True)
+            update: Whether to refresh the index before responding
+                ("true", "false" or "lazy"; server default is "true").
+                "false"/"lazy" skip the synchronous index build and serve
+                whatever is already materialized.
+            partition: Restrict the query to one partition of a
+                partitioned database (ids prefixed "partition:")
 
         Returns:
             ViewResult with matching rows
         """
-        # Build query parameters
-        params: dict[str, Any] = {}
-        if key is not None:
-            params["key"] = json.dumps(key)
-        if startkey is not None:
-            params["startkey"] = json.dumps(startkey)
-        if endkey is not None:
-            params["endkey"] = json.dumps(endkey)
-        if limit is not None:
-            params["limit"] = limit
-        if skip is not None:
-            params["skip"] = skip
-        if descending:
-            params["descending"] = "true"
-        if include_docs:
-            params["include_docs"] = "true"
-        if group:
-            params["group"] = "true"
+        # Build query parameters table-driven: JSON-encoded keys, then
+        # plain values, then boolean flags
+        params: dict[str, Any] = {
+            name: orjson.dumps(value).decode()
+            for name, value in (
+                ("key", key),
+                ("startkey", startkey),
+                ("endkey", endkey),
+            )
+            if value is not None
+        }
+        params.update(
+            (name, value)
+            for name, value in (
+                ("startkey_docid", startkey_docid),
+                ("limit", limit),
+                ("skip", skip),
+                ("update", update),
+            )
+            if value is not None
+        )
+        params.update(
+            (name, "true")
+            for name, flag in (
+                ("descending", descending),
+                ("include_docs", include_docs),
+                ("group", group),
+            )
+            if flag
+        )
         if not reduce:
             params["reduce"] = "false"
 
         # Use POST with keys, or GET for other queries
-        url = f"{self._name}/_design/{design_doc}/_view/{view_name}"
+        if partition is not None:
+            url = (
+                f"{self._name}/_partition/{partition}"
+                f"/_design/{design_doc}/_view/{view_name}"
+            )
+        else:
+            url = f"{self._name}/_design/{design_doc}/_view/{view_name}"
 
         if keys is not None:
             # POST request for querying multiple keys
-            response = await self._client.post(url, json={"keys": keys}, params=params)
+            response = await self._client.post(
+                url,
+                content=orjson.dumps({"keys": keys}),
+                headers={"Content-Type": "application/json"},
+                params=params,
+            )
         else:
             response = await self._client.get(url, params=params)
 
         response.raise_for_status()
-        view_response = ViewResponse.model_validate(response.json())
-        return ViewResult(view_response.rows)
+        return ViewResult(orjson.loads(response.content)["rows"])
+
+    async def view_queries(
+        self,
+        design_doc: str,
+        view_name: str,
+        queries: list[dict[str, Any]],
+    ) -> list[ViewResult]:
+        """Run several queries against one view in a single request.
+
+        Posts to the view's /queries endpoint, so N logical queries cost
+        one roundtrip. Each entry in queries is a dict of regular view
+        parameters (e.g. {"group": True} or {"reduce": False}).
+
+        Returns:
+            One ViewResult per query, in order.
+        """
+        url = f"{self._name}/_design/{design_doc}/_view/{view_name}/queries"
+        response = await self._client.post(
+            url,
+            content=orjson.dumps({"queries": queries}),
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+        results = orjson.loads(response.content)["results"]
+        return [ViewResult(result["rows"]) for result in results]
+
+    async def paginate(
+        self,
+        design_doc: str,
+        view_name: str,
+        *,
+        page_size: int,
+    ) -> AsyncIterator[ViewResult]:
+        """Iterate a map view in pages using key-range continuation.
+
+        Each page seeks to the last seen row with startkey/startkey_docid,
+        an O(log N) B-tree seek, instead of skip=N which walks every
+        skipped row. Yields ViewResult pages until the view is exhausted.
+        """
+        page = await self.view(design_doc, view_name, limit=page_size)
+        while len(page):
+            yield page
+            if len(page) < page_size:
+                return
+            last = list(page)[-1]
+            page = await self.view(
+                design_doc,
+                view_name,
+                startkey=last.key,
+                startkey_docid=last.id,
+                skip=1,
+                limit=page_size,
+            )
@@ -1,10 +1,18 @@
 from collections.abc import Iterator
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+from ._fastpath import extract_docs, extract_keys, extract_values
+
+# Response models are read-only snapshots of what CouchDB sent: frozen, with
+# unknown fields dropped instead of tracked.
+_RESPONSE_CONFIG = ConfigDict(extra="ignore", frozen=True)
 
 
 class ServerInfo(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     couchdb: str
     version: str
     git_sha: str
@@ -13,6 +21,8 @@ class ServerInfo(BaseModel):
 
 
 class DatabaseInfo(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     db_name: str
     doc_count: int
     doc_del_count: int
@@ -28,12 +38,16 @@ class DatabaseInfo(BaseModel):
 
 
 class DocumentResponse(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     ok: bool
     id: str
     rev: str
 
 
 class AllDocsRow(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     id: str
     key: str
     value: dict[str, str]
@@ -41,12 +55,16 @@ class AllDocsRow(BaseModel):
 
 
 class AllDocsResponse(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     total_rows: int
     offset: int
     rows: list[AllDocsRow]
 
 
 class BulkResult(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     ok: bool | None = None
     id: str
     rev: str | None = None
@@ -54,6 +72,11 @@ class BulkResult(BaseModel):
     reason: str | None = None
 
 
+# Validates a whole _bulk_docs response in one pydantic-core call instead of
+# one model_validate per row.
+_BULK_RESULTS_ADAPTER = TypeAdapter(list[BulkResult])
+
+
 class FindQuery(BaseModel):
     selector: dict[str, Any]
     fields: list[str] | None = None
@@ -64,6 +87,8 @@ class FindQuery(BaseModel):
 
 
 class FindResponse(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     docs: list[dict[str, Any]]
     bookmark: str | None = None
     warning: str | None = None
@@ -71,6 +96,8 @@ class FindResponse(BaseModel):
 
 
 class FindResult:
+    __slots__ = ("_docs",)
+
     def __init__(self, docs: list[dict[str, Any]]) -> None:
         self._docs = docs
 
@@ -82,6 +109,8 @@ class FindResult:
 
 
 class ViewRow(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     id: str | None = None  # Not present in reduce views
     key: Any
     value: Any
@@ -89,31 +118,49 @@ class ViewRow(BaseModel):
 
 
 class ViewResponse(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     total_rows: int | None = None  # Not present in reduce views
     offset: int | None = None  # Not present in reduce views
     rows: list[ViewRow]
 
 
 class ViewResult:
-    """Iterable wrapper for view results with convenience methods."""
+    """Iterable wrapper for view results with convenience methods.
+
+    Holds the raw row dicts from the response; ViewRow models are only
+    constructed lazily when rows are iterated.
+    """
+
+    __slots__ = ("_docs", "_keys", "_rows", "_values")
 
-    def __init__(self, rows: list[ViewRow]) -> None:
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
         self._rows = rows
+        # Extracted lists are computed once on first access
+        self._keys: list[Any] | None = None
+        self._values: list[Any] | None = None
+        self._docs: list[dict[str, Any]] | None = None
 
     def __iter__(self) -> Iterator[ViewRow]:
-        return iter(self._rows)
+        return (ViewRow.model_construct(**row) for row in self._rows)
 
     def __len__(self) -> int:
         return len(self._rows)
 
     def keys(self) -> list[Any]:
-        """Extract all keys from view results."""
-        return [row.key for row in self._rows]
+        """Extract all keys from view results (cached after first call)."""
+        if self._keys is None:
+            self._keys = extract_keys(self._rows)
+        return self._keys
 
     def values(self) -> list[Any]:
-        """Extract all values from view results."""
-        return [row.value for row in self._rows]
+        """Extract all values from view results (cached after first call)."""
+        if self._values is None:
+            self._values = extract_values(self._rows)
+        return self._values
 
     def docs(self) -> list[dict[str, Any]]:
-        """Extract all documents (requires include_docs=true)."""
-        return [row.doc for row in self._rows if row.doc is not None]
+        """Extract all documents (requires include_docs=true; cached)."""
+        if self._docs is None:
+            self._docs = extract_docs(self._rows)
+        return self._docs
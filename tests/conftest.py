@@ -1,15 +1,37 @@
 """Shared pytest fixtures for all test files."""
 
-from collections.abc import AsyncGenerator
+import cProfile
+import os
+from collections.abc import AsyncGenerator, Generator
+from pathlib import Path
 
 import pytest
 
 from couch import CouchClient, CouchConfig, Database, connect
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _profile(request: pytest.FixtureRequest) -> Generator[None]:
+    """Dump a per-test cProfile when COUCH_PROF is set.
+
+    The suite is network-bound against CouchDB; profile before assuming a
+    CPU-side optimization will pay off. Inspect with e.g. snakeviz.
+    """
+    if not os.getenv("COUCH_PROF"):
+        yield
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    yield
+    profiler.disable()
+    out_dir = Path(".prof")
+    out_dir.mkdir(exist_ok=True)
+    profiler.dump_stats(out_dir / f"{request.node.name}.prof")
+
+
+@pytest.fixture(scope="session")
 async def client() -> AsyncGenerator[CouchClient]:
-    """Create a CouchDB client and clean up all databases after tests."""
+    """Create one CouchDB client for the whole session."""
     config = CouchConfig(
         url="http://localhost:5984",
         username="admin",
@@ -17,15 +39,107 @@ async def client() -> AsyncGenerator[CouchClient]:
     )
 
     async with connect(config) as client:
+        # Start from and return to a clean server
+        await client.delete_all_databases()
         yield client
-        # Cleanup: delete all non-system databases after each test
-        dbs = await client.all_databases()
-        for db in dbs:
-            await client.delete_database(db)
+        await client.delete_all_databases()
 
 
-@pytest.fixture
-async def db(client: CouchClient) -> Database:
-    """Create a test database."""
+@pytest.fixture(scope="session")
+async def _session_db(client: CouchClient) -> Database:
+    """Create the shared test database once per session."""
     await client.create_database("test_db")
     return client.database("test_db")
+
+
+@pytest.fixture
+async def db(_session_db: Database) -> AsyncGenerator[Database]:
+    """Hand out the session database; undo a test's writes afterwards.
+
+    Teardown purges everything the test wrote (design docs included) with
+    a single _purge call, which is far cheaper than dropping and
+    recreating the database per test. Purging (unlike _deleted tombstones)
+    erases the revision trees, so a later test reusing an id gets fresh
+    1- revisions.
+    """
+    yield _session_db
+    response = await _session_db._client.get(_session_db._all_docs_url)
+    rows = response.json()["rows"]
+    if rows:
+        response = await _session_db._client.post(
+            f"{_session_db.name}/_purge",
+            json={row["id"]: [row["value"]["rev"]] for row in rows},
+        )
+        response.raise_for_status()
+
+
+USERS_DESIGN_DOC = {
+    "_id": "_design/users",
+    "views": {
+        "by_age": {"map": "function(doc) { if (doc.age) emit(doc.age, doc.name); }"}
+    },
+}
+
+STATS_DESIGN_DOC = {
+    "_id": "_design/stats",
+    "views": {
+        "count_by_status": {
+            "map": "function(doc) { if (doc.status) emit(doc.status, 1); }",
+            "reduce": "_count",
+        }
+    },
+}
+
+
+@pytest.fixture
+async def users_design(db: Database) -> Database:
+    """Database with the shared _design/users view installed."""
+    await db.save(dict(USERS_DESIGN_DOC))
+    return db
+
+
+@pytest.fixture
+async def stats_design(db: Database) -> Database:
+    """Database with the shared _design/stats reduce view installed.
+
+    A zero-row warm-up query builds the empty index structure up front,
+    so the test's own query only pays an incremental update. The view
+    uses the built-in _count reducer, which runs in Erlang rather than
+    the JS server.
+    """
+    await db.save(dict(STATS_DESIGN_DOC))
+    await db.view("stats", "count_by_status", limit=0, update="true")
+    return db
+
+
+# Canonical user documents shared across tests; the first three are the
+# seed set, the rest are per-test deltas. Tests take copies via users().
+USERS = (
+    {"_id": "user1", "name": "Alice", "age": 25},
+    {"_id": "user2", "name": "Bob", "age": 35},
+    {"_id": "user3", "name": "Charlie", "age": 30},
+    {"_id": "user4", "name": "Dave", "age": 40},
+    {"_id": "user5", "name": "Eve", "age": 45},
+    {"_id": "user6", "name": "Dana", "age": 25},
+)
+
+BASE_USERS = USERS[:3]
+
+
+def users(*ids: str) -> list[dict[str, object]]:
+    """Return fresh copies of the canonical users with the given ids."""
+    return [dict(user) for user in USERS if user["_id"] in ids]
+
+
+@pytest.fixture
+async def seed_users(db: Database) -> Database:
+    """Database with the users view and the canonical user set loaded.
+
+    The design doc rides along in the same _bulk_docs request as the data
+    (CouchDB accepts _design/* ids there), so seeding costs one roundtrip.
+    Tests needing extra users bulk_save only their delta documents.
+    """
+    await db.bulk_save(
+        [dict(USERS_DESIGN_DOC), *(dict(user) for user in BASE_USERS)]
+    )
+    return db
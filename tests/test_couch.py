@@ -18,8 +18,11 @@ async def test_create_duplicate_database_raises_error(client: CouchClient) -> No
 
 
 async def test_all_databases(client: CouchClient) -> None:
+    await client.create_database("list_me")
     dbs = await client.all_databases()
-    assert len(dbs) == 0
+    assert "list_me" in dbs
+    assert all(not db.startswith("_") for db in dbs)
+    await client.delete_database("list_me")
 
 
 async def test_delete_database(client: CouchClient) -> None:
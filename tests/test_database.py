@@ -1,16 +1,12 @@
 from couch import CouchClient, Database, DatabaseInfo
 
 
-async def test_database_returns_database_instance(client: CouchClient) -> None:
-    await client.create_database("test_db")
-    db = client.database("test_db")
+async def test_database_returns_database_instance(db: Database) -> None:
     assert isinstance(db, Database)
     assert db.name == "test_db"
 
 
-async def test_database_info_returns_metadata(client: CouchClient) -> None:
-    await client.create_database("test_db")
-    db = client.database("test_db")
+async def test_database_info_returns_metadata(db: Database) -> None:
     info = await db.get_info()
     assert isinstance(info, DatabaseInfo)
     assert info.db_name == "test_db"
@@ -21,10 +17,9 @@ async def test_database_info_returns_metadata(client: CouchClient) -> None:
 
 
 async def test_database_exists_returns_true_for_existing_db(
-    client: CouchClient,
+    client: CouchClient, db: Database
 ) -> None:
-    await client.create_database("test_db")
-    exists = await client.database_exists("test_db")
+    exists = await client.database_exists(db.name)
     assert exists is True
 
 
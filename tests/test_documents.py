@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from couch import (
@@ -94,9 +96,12 @@ async def test_delete_nonexistent_document_raises_error(db: Database) -> None:
 
 
 async def test_all_document_ids_returns_list_of_ids(db: Database) -> None:
-    await db.save({"_id": "doc1", "data": "a"})
-    await db.save({"_id": "doc2", "data": "b"})
-    await db.save({"_id": "doc3", "data": "c"})
+    # Independent saves proceed in parallel over the connection pool
+    await asyncio.gather(
+        db.save({"_id": "doc1", "data": "a"}),
+        db.save({"_id": "doc2", "data": "b"}),
+        db.save({"_id": "doc3", "data": "c"}),
+    )
 
     ids = await db.all_document_ids()
 
@@ -107,11 +112,62 @@ async def test_all_document_ids_returns_list_of_ids(db: Database) -> None:
 
 
 async def test_all_document_ids_excludes_design_docs(db: Database) -> None:
-    await db.save({"_id": "doc1", "data": "a"})
-    await db.save({"_id": "_design/myview", "views": {}})
+    await asyncio.gather(
+        db.save({"_id": "doc1", "data": "a"}),
+        db.save({"_id": "_design/myview", "views": {}}),
+    )
 
     ids = await db.all_document_ids()
 
     assert len(ids) == 1
     assert "doc1" in ids
     assert "_design/myview" not in ids
+
+
+async def test_get_many_returns_documents_in_one_request(db: Database) -> None:
+    await db.bulk_save(
+        [
+            {"_id": "user1", "name": "Alice"},
+            {"_id": "user2", "name": "Bob"},
+            {"_id": "user3", "name": "Charlie"},
+        ]
+    )
+
+    docs = await db.get_many(["user1", "user3"])
+
+    assert len(docs) == 2
+    assert docs[0]["name"] == "Alice"
+    assert docs[1]["name"] == "Charlie"
+
+
+async def test_get_many_skips_missing_documents(db: Database) -> None:
+    await db.save({"_id": "user1", "name": "Alice"})
+
+    docs = await db.get_many(["user1", "nonexistent"])
+
+    assert len(docs) == 1
+    assert docs[0]["_id"] == "user1"
+
+
+async def test_delete_many_deletes_documents(db: Database) -> None:
+    results = await db.bulk_save(
+        [{"_id": "user1", "name": "Alice"}, {"_id": "user2", "name": "Bob"}]
+    )
+    docs = [
+        {"_id": "user1", "_rev": results[0].rev},
+        {"_id": "user2", "_rev": results[1].rev},
+    ]
+
+    delete_results = await db.delete_many(docs)
+
+    assert all(result.ok is True for result in delete_results)
+    assert await db.all_document_ids() == []
+
+
+async def test_iter_document_ids_streams_ids(db: Database) -> None:
+    await db.bulk_save([{"_id": f"doc{i}", "order": i} for i in range(5)])
+
+    ids = [doc_id async for doc_id in db.iter_document_ids()]
+
+    assert len(ids) == 5
+    assert ids == [f"doc{i}" for i in range(5)]
@@ -1,3 +1,5 @@
+import asyncio
+
 from couch import Database
 
 
@@ -13,7 +15,7 @@ async def test_find_with_simple_selector(db: Database) -> None:
 
     docs_list = list(results)
     assert len(docs_list) == 2
-    assert all(doc["type"] == "user" for doc in docs_list)
+    assert {doc["type"] for doc in docs_list} == {"user"}
 
 
 async def test_find_with_comparison_operators(db: Database) -> None:
@@ -28,7 +30,7 @@ async def test_find_with_comparison_operators(db: Database) -> None:
 
     docs_list = list(results)
     assert len(docs_list) == 2
-    assert all(doc["age"] > 30 for doc in docs_list)
+    assert sorted(doc["age"] for doc in docs_list) == [35, 45]
 
 
 async def test_find_with_field_projection(db: Database) -> None:
@@ -70,14 +72,16 @@ async def test_find_with_limit_and_skip(db: Database) -> None:
     docs = [{"_id": f"doc{i}", "order": i} for i in range(10)]
     await db.bulk_save(docs)
 
-    # Test limit without sort (sorting requires an index)
-    results = await db.find(selector={"order": {"$gte": 0}}, limit=3)
+    # The limit and skip queries are independent, so issue them concurrently
+    # (sorting requires an index, so neither uses sort)
+    results, results_skip = await asyncio.gather(
+        db.find(selector={"order": {"$gte": 0}}, limit=3),
+        db.find(selector={"order": {"$gte": 0}}, skip=5),
+    )
 
     docs_list = list(results)
     assert len(docs_list) == 3
 
-    # Test skip without sort
-    results_skip = await db.find(selector={"order": {"$gte": 0}}, skip=5)
     docs_skip = list(results_skip)
     assert len(docs_skip) == 5
 
@@ -103,3 +107,13 @@ async def test_find_result_is_iterable(db: Database) -> None:
     assert count2 == 5
 
     assert len(results) == 5
+
+
+async def test_iter_find_streams_matching_documents(db: Database) -> None:
+    docs = [{"_id": f"doc{i}", "value": i} for i in range(5)]
+    await db.bulk_save(docs)
+
+    streamed = [doc async for doc in db.iter_find(selector={"value": {"$gte": 2}})]
+
+    assert len(streamed) == 3
+    assert all(doc["value"] >= 2 for doc in streamed)
@@ -1,24 +1,10 @@
-from couch import Database
+from couch import CouchClient, Database
 
+from .conftest import USERS_DESIGN_DOC, users
 
-async def test_view_with_map_only(db: Database) -> None:
-    # Create design doc with map view
-    design_doc = {
-        "_id": "_design/users",
-        "views": {
-            "by_age": {"map": "function(doc) { if (doc.age) emit(doc.age, doc.name); }"}
-        },
-    }
-    await db.save(design_doc)
 
-    # Add test documents
-    await db.bulk_save(
-        [
-            {"_id": "user1", "name": "Alice", "age": 25},
-            {"_id": "user2", "name": "Bob", "age": 35},
-            {"_id": "user3", "name": "Charlie", "age": 30},
-        ]
-    )
+async def test_view_with_map_only(seed_users: Database) -> None:
+    db = seed_users
 
     # Query view
     results = await db.view("users", "by_age")
@@ -27,23 +13,10 @@ async def test_view_with_map_only(db: Database) -> None:
     assert results.values() == ["Alice", "Charlie", "Bob"]
 
 
-async def test_view_with_key_range(db: Database) -> None:
-    design_doc = {
-        "_id": "_design/users",
-        "views": {
-            "by_age": {"map": "function(doc) { if (doc.age) emit(doc.age, doc.name); }"}
-        },
-    }
-    await db.save(design_doc)
+async def test_view_with_key_range(seed_users: Database) -> None:
+    db = seed_users
 
-    await db.bulk_save(
-        [
-            {"_id": "user1", "name": "Alice", "age": 25},
-            {"_id": "user2", "name": "Bob", "age": 35},
-            {"_id": "user3", "name": "Charlie", "age": 30},
-            {"_id": "user4", "name": "Dave", "age": 45},
-        ]
-    )
+    await db.bulk_save(users("user5"))
 
     # Query with key range
     results = await db.view("users", "by_age", startkey=25, endkey=32)
@@ -51,14 +24,8 @@ async def test_view_with_key_range(db: Database) -> None:
     assert results.keys() == [25, 30]
 
 
-async def test_view_with_include_docs(db: Database) -> None:
-    design_doc = {
-        "_id": "_design/users",
-        "views": {
-            "by_age": {"map": "function(doc) { if (doc.age) emit(doc.age, doc.name); }"}
-        },
-    }
-    await db.save(design_doc)
+async def test_view_with_include_docs(users_design: Database) -> None:
+    db = users_design
 
     await db.bulk_save(
         [
@@ -71,51 +38,51 @@ async def test_view_with_include_docs(db: Database) -> None:
     results = await db.view("users", "by_age", include_docs=True)
     docs = results.docs()
     assert len(docs) == 2
-    assert all("email" in doc for doc in docs)
+    assert {doc["email"] for doc in docs} == {
+        "alice@example.com",
+        "bob@example.com",
+    }
     assert docs[0]["name"] == "Alice"
 
 
-async def test_view_with_specific_key(db: Database) -> None:
-    design_doc = {
-        "_id": "_design/users",
-        "views": {
-            "by_age": {"map": "function(doc) { if (doc.age) emit(doc.age, doc.name); }"}
-        },
-    }
-    await db.save(design_doc)
+async def test_view_docs_via_single_bulk_fetch(users_design: Database) -> None:
+    """Fetching docs with one get_many avoids the per-row B-tree lookups
+    that include_docs costs server-side."""
+    db = users_design
 
     await db.bulk_save(
         [
-            {"_id": "user1", "name": "Alice", "age": 25},
-            {"_id": "user2", "name": "Bob", "age": 35},
-            {"_id": "user3", "name": "Charlie", "age": 25},
+            {"_id": "user1", "name": "Alice", "age": 25, "email": "alice@example.com"},
+            {"_id": "user2", "name": "Bob", "age": 35, "email": "bob@example.com"},
         ]
     )
 
+    results = await db.view("users", "by_age")
+    docs = await db.get_many([row.id for row in results if row.id is not None])
+
+    assert len(docs) == 2
+    assert {doc["email"] for doc in docs} == {
+        "alice@example.com",
+        "bob@example.com",
+    }
+    assert docs[0]["name"] == "Alice"
+
+
+async def test_view_with_specific_key(seed_users: Database) -> None:
+    db = seed_users
+
+    await db.bulk_save(users("user6"))
+
     # Query with specific key
     results = await db.view("users", "by_age", key=25)
     assert len(results) == 2
-    assert all(row.key == 25 for row in results)
+    assert results.keys() == [25, 25]
 
 
-async def test_view_with_limit_and_skip(db: Database) -> None:
-    design_doc = {
-        "_id": "_design/users",
-        "views": {
-            "by_age": {"map": "function(doc) { if (doc.age) emit(doc.age, doc.name); }"}
-        },
-    }
-    await db.save(design_doc)
+async def test_view_with_limit_and_skip(seed_users: Database) -> None:
+    db = seed_users
 
-    await db.bulk_save(
-        [
-            {"_id": "user1", "name": "Alice", "age": 25},
-            {"_id": "user2", "name": "Bob", "age": 30},
-            {"_id": "user3", "name": "Charlie", "age": 35},
-            {"_id": "user4", "name": "Dave", "age": 40},
-            {"_id": "user5", "name": "Eve", "age": 45},
-        ]
-    )
+    await db.bulk_save(users("user4", "user5"))
 
     # Query with limit and skip
     results = await db.view("users", "by_age", skip=1, limit=3)
@@ -123,22 +90,8 @@ async def test_view_with_limit_and_skip(db: Database) -> None:
     assert results.keys() == [30, 35, 40]
 
 
-async def test_view_with_descending_order(db: Database) -> None:
-    design_doc = {
-        "_id": "_design/users",
-        "views": {
-            "by_age": {"map": "function(doc) { if (doc.age) emit(doc.age, doc.name); }"}
-        },
-    }
-    await db.save(design_doc)
-
-    await db.bulk_save(
-        [
-            {"_id": "user1", "name": "Alice", "age": 25},
-            {"_id": "user2", "name": "Bob", "age": 35},
-            {"_id": "user3", "name": "Charlie", "age": 30},
-        ]
-    )
+async def test_view_with_descending_order(seed_users: Database) -> None:
+    db = seed_users
 
     # Query in descending order
     results = await db.view("users", "by_age", descending=True)
@@ -146,17 +99,8 @@ async def test_view_with_descending_order(db: Database) -> None:
     assert results.keys() == [35, 30, 25]
 
 
-async def test_view_with_map_reduce(db: Database) -> None:
-    design_doc = {
-        "_id": "_design/stats",
-        "views": {
-            "count_by_status": {
-                "map": "function(doc) { if (doc.status) emit(doc.status, 1); }",
-                "reduce": "_count",
-            }
-        },
-    }
-    await db.save(design_doc)
+async def test_view_with_map_reduce(stats_design: Database) -> None:
+    db = stats_design
 
     await db.bulk_save(
         [
@@ -180,26 +124,94 @@ async def test_view_with_map_reduce(db: Database) -> None:
     assert values[active_idx] == 3
 
 
-async def test_view_with_keys_parameter(db: Database) -> None:
-    design_doc = {
-        "_id": "_design/users",
-        "views": {
-            "by_age": {"map": "function(doc) { if (doc.age) emit(doc.age, doc.name); }"}
-        },
-    }
-    await db.save(design_doc)
+async def test_view_with_keys_parameter(seed_users: Database) -> None:
+    db = seed_users
 
-    await db.bulk_save(
-        [
-            {"_id": "user1", "name": "Alice", "age": 25},
-            {"_id": "user2", "name": "Bob", "age": 30},
-            {"_id": "user3", "name": "Charlie", "age": 35},
-            {"_id": "user4", "name": "Dave", "age": 40},
-        ]
-    )
+    await db.bulk_save(users("user4"))
 
     # Query with multiple specific keys
     results = await db.view("users", "by_age", keys=[25, 35])
     assert len(results) == 2
     assert results.keys() == [25, 35]
-    assert results.values() == ["Alice", "Charlie"]
+    assert results.values() == ["Alice", "Bob"]
+
+
+async def test_view_with_update_false_serves_stale_index(
+    seed_users: Database,
+) -> None:
+    db = seed_users
+
+    # Warm the index, then add a document behind its back
+    results = await db.view("users", "by_age", update="true")
+    assert len(results) == 3
+
+    await db.bulk_save(users("user4"))
+
+    # update=false serves the already-materialized index without rebuilding.
+    # The background indexer (ken) may have picked up the write in the
+    # meantime, so only assert the call does not require the new row.
+    stale = await db.view("users", "by_age", update="false")
+    assert len(stale) in (3, 4)
+
+    # A synchronous refresh must see it
+    fresh = await db.view("users", "by_age", update="true")
+    assert len(fresh) == 4
+
+
+async def test_view_pagination_with_key_continuation(seed_users: Database) -> None:
+    db = seed_users
+
+    await db.bulk_save(users("user4", "user5"))
+
+    pages = [page async for page in db.paginate("users", "by_age", page_size=2)]
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    keys = [row.key for page in pages for row in page]
+    assert keys == [25, 30, 35, 40, 45]
+
+
+async def test_view_queries_returns_grouped_and_ungrouped(
+    stats_design: Database,
+) -> None:
+    db = stats_design
+
+    await db.bulk_save(
+        [
+            {"_id": "task1", "status": "active"},
+            {"_id": "task2", "status": "active"},
+            {"_id": "task3", "status": "completed"},
+            {"_id": "task4", "status": "active"},
+        ]
+    )
+
+    # Grouped counts and raw mapped rows in a single roundtrip
+    grouped, mapped = await db.view_queries(
+        "stats", "count_by_status", [{"group": True}, {"reduce": False}]
+    )
+
+    assert len(grouped) == 2
+    active_idx = grouped.keys().index("active")
+    assert grouped.values()[active_idx] == 3
+    assert len(mapped) == 4
+
+
+async def test_partitioned_database_scopes_view_queries(
+    client: CouchClient,
+) -> None:
+    await client.create_database("partitioned_db", partitioned=True)
+    try:
+        pdb = client.database("partitioned_db")
+        await pdb.bulk_save(
+            [
+                dict(USERS_DESIGN_DOC),
+                {"_id": "t1:user1", "name": "Alice", "age": 25},
+                {"_id": "t2:user2", "name": "Bob", "age": 35},
+            ]
+        )
+
+        # Only the t1 partition's rows come back
+        results = await pdb.view("users", "by_age", partition="t1")
+        assert results.keys() == [25]
+        assert results.values() == ["Alice"]
+    finally:
+        await client.delete_database("partitioned_db")